@@ -1,4 +1,6 @@
-import io
+import gettext
+import os
+from concurrent.futures import ThreadPoolExecutor
 from shutil import copy2
 from pathlib import Path
 
@@ -7,89 +9,302 @@ import json
 import re
 import polib
 from babel.messages.pofile import read_po
-from babel.messages.mofile import write_mo
 from babel.support import Translations
 from mkdocs.plugins import event_priority
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# match {{ trans("key") }} including cases where quotes are escaped
+_TRANS_RE = re.compile(r"{{\s*trans\(\s*\\?['\"]([^'\"]+)\\?['\"]\s*\)\s*}}")
+_CONFIG_OPEN = '<script id="__config" type="application/json">'
+_HTML_LANG_RE = re.compile(r'(<html[^>]*?lang=")[^"]*(")')
+_LONG_DIGITS_RE = re.compile(r"\d{20}")
+
+# Flattened locale YAML for the current build, keyed by id(config).
+_YAML_CACHE = {}
+# (i18n plugin, default locale) for the current build, keyed by id(config).
+_I18N_CACHE = {}
+# Translators built for the current build, keyed by id(config).
+_TRANSLATOR_CACHE = {}
+# Rendered external-link-modal <script> tags, keyed by locale.
+_MODAL_CACHE = {}
+
 
 def _flatten(prefix, value, dest):
-    if isinstance(value, dict):
-        for k, v in value.items():
-            key = f"{prefix}.{k}" if prefix else k
-            _flatten(key, v, dest)
-    else:
-        dest[prefix] = value
+    # Iterative walk; children are pushed in reverse so keys keep document order.
+    stack = [(prefix, value)]
+    while stack:
+        prefix, value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(
+                (f"{prefix}.{k}" if prefix else k, v) for k, v in reversed(value.items())
+            )
+        else:
+            dest[prefix] = value
+
+
+def _load_yaml_file(path):
+    data = yaml.load(path.read_bytes(), Loader=_YamlLoader) or {}
+    flat = {}
+    _flatten("", data, flat)
+    return path.stem, flat
 
 
 def _load_yaml_translations(locale_dir):
     translations = {}
     if not locale_dir.exists():
         return translations
-    for path in locale_dir.glob("*.yml"):
-        data = yaml.safe_load(path.read_text()) or {}
-        flat = {}
-        _flatten("", data, flat)
-        translations[path.stem] = flat
+    paths = list(locale_dir.glob("*.yml"))
+    if not paths:
+        return translations
+    # Overlap the file reads on a small pool (libyaml parsing itself holds the GIL);
+    # results keep glob order.
+    with ThreadPoolExecutor(max_workers=min(4, len(paths))) as executor:
+        for stem, flat in executor.map(_load_yaml_file, paths):
+            translations[stem] = flat
     return translations
 
 
-def _load_gettext_translations(i18n_dir):
-    translations = {}
-    if not i18n_dir.exists():
-        return translations
-    for lang_dir in i18n_dir.iterdir():
-        if not lang_dir.is_dir():
+def _catalog_to_translations(catalog):
+    """
+    Wrap a parsed babel Catalog in Translations directly, without an in-memory .mo round-trip.
+
+    Mirrors what write_mo + GNUTranslations would produce: the header entry and its metadata,
+    translated non-fuzzy entries, context-prefixed ids, and one (msgid, n) key per plural form
+    with empty forms falling back to the msgid.
+    """
+    translator = Translations()
+    entries = translator._catalog
+    messages = iter(catalog)
+
+    header = next(messages)
+    entries[""] = header.string
+    last_key = None
+    for item in header.string.split("\n"):
+        item = item.strip()
+        # msgcat conflict markers are skipped by GNUTranslations as well
+        if not item or (item.startswith("#-#-#-#-#") and item.endswith("#-#-#-#-#")):
             continue
-        lc_dir = lang_dir / "LC_MESSAGES"
-        if not lc_dir.exists():
+        if ":" in item:
+            key, value = item.split(":", 1)
+            last_key = key.strip().lower()
+            value = value.strip()
+            translator._info[last_key] = value
+            if last_key == "content-type" and "charset=" in value:
+                translator._charset = value.split("charset=")[1]
+            elif last_key == "plural-forms":
+                translator.plural = gettext.c2py(value.split(";")[1].split("plural=")[1])
+        elif last_key:
+            translator._info[last_key] += "\n" + item
+
+    for message in messages:
+        if not message.string or message.fuzzy:
             continue
-        po_path = lc_dir / "messages.po"
-        mo_path = lc_dir / "messages.mo"
-        translator = None
-        if po_path.exists():
-            with po_path.open("r", encoding="utf-8") as po_file:
-                catalog = read_po(po_file)
-            buffer = io.BytesIO()
-            write_mo(buffer, catalog)
-            buffer.seek(0)
-            translator = Translations(fp=buffer)
-        elif mo_path.exists():
-            with mo_path.open("rb") as mo_file:
-                translator = Translations(mo_file)
-        if translator is not None:
-            translations[lang_dir.name] = translator
-    return translations
+        if message.pluralizable:
+            msgid = message.id[0]
+            if message.context:
+                msgid = f"{message.context}\x04{msgid}"
+            for index, string in enumerate(message.string):
+                entries[(msgid, index)] = string or message.id[min(index, 1)]
+        else:
+            msgid = message.id
+            if message.context:
+                msgid = f"{message.context}\x04{msgid}"
+            entries[msgid] = message.string
+    return translator
+
+
+def _load_gettext_catalog(po_path, mo_path):
+    """
+    Load one locale's catalog. The .po is the source of truth (on_config keeps it in sync
+    with the YAML); a .mo is only read when there is no .po.
+    """
+    if po_path.exists():
+        with po_path.open("r", encoding="utf-8") as po_file:
+            catalog = read_po(po_file)
+        return _catalog_to_translations(catalog)
+    if mo_path.exists():
+        with mo_path.open("rb") as mo_file:
+            return Translations(mo_file)
+    return None
+
+
+class _LazyGettextMap:
+    """
+    Mapping of locale -> Translations that only parses a catalog the first time it is requested.
+    """
+
+    def __init__(self, paths):
+        self._paths = paths
+        self._loaded = {}
+
+    def get(self, lang, default=None):
+        if lang in self._loaded:
+            return self._loaded[lang]
+        paths = self._paths.get(lang)
+        if paths is None:
+            return default
+        translator = self._loaded[lang] = _load_gettext_catalog(*paths)
+        return translator
+
+
+def _load_gettext_translations(i18n_dir):
+    paths = {}
+    if i18n_dir.exists():
+        for lang_dir in i18n_dir.iterdir():
+            if not lang_dir.is_dir():
+                continue
+            lc_dir = lang_dir / "LC_MESSAGES"
+            if not lc_dir.exists():
+                continue
+            po_path = lc_dir / "messages.po"
+            mo_path = lc_dir / "messages.mo"
+            if po_path.exists() or mo_path.exists():
+                paths[lang_dir.name] = (po_path, mo_path)
+    return _LazyGettextMap(paths)
 
 
-def _build_translator(config):
+def _build_translator(config, yaml_translations):
     docs_dir = Path(config.get("docs_dir", "docs"))
-    yaml_translations = _load_yaml_translations(docs_dir / "locale")
     gettext_translations = _load_gettext_translations(docs_dir / "i18n")
     default_lang = config.get("theme", {}).get("language", "en")
 
+    # Per-language lookup tables: YAML strings overlaid with gettext ones, built on first use
+    # so untouched locales never load their catalogs.
+    merged = {}
+
+    def _table(lang):
+        table = merged.get(lang)
+        if table is None:
+            table = dict(yaml_translations.get(lang, {}))
+            translator = gettext_translations.get(lang)
+            if translator:
+                # Resolve through gettext() so plural-only msgids fall back to their
+                # (msgid, plural(1)) form exactly as a direct lookup would.
+                msgids = {key[0] if isinstance(key, tuple) else key for key in translator._catalog}
+                for key in msgids:
+                    value = translator.gettext(key)
+                    if value and value != key:
+                        table[key] = value
+            merged[lang] = table
+        return table
+
+    default_table = _table(default_lang)
+
     def translate(key, lang=None):
-        current_lang = lang or default_lang
-        translator = gettext_translations.get(current_lang)
-        if translator:
-            value = translator.gettext(key)
-            if value and value != key:
-                return value
-        yaml_lang = yaml_translations.get(current_lang, {})
-        if key in yaml_lang:
-            return yaml_lang[key]
-        fallback_translator = gettext_translations.get(default_lang)
-        if fallback_translator:
-            value = fallback_translator.gettext(key)
-            if value and value != key:
-                return value
-        return yaml_translations.get(default_lang, {}).get(key, key)
+        table = _table(lang or default_lang)
+        if key in table:
+            return table[key]
+        return default_table.get(key, key)
 
     return translate
 
 
+def _dump_json_bytes(data):
+    """
+    Serialize to UTF-8 JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which stdlib json still accepts
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _set_config_base(config_json, base):
+    """
+    Return Material's __config JSON with "base" replaced, serialized compactly.
+    """
+    # orjson rejects NaN/Infinity and silently turns integers wider than 64 bits into floats,
+    # so anything it cannot round-trip exactly goes through stdlib json instead.
+    if orjson is not None and not _LONG_DIGITS_RE.search(config_json):
+        try:
+            cfg = orjson.loads(config_json)
+            cfg["base"] = base
+            return orjson.dumps(cfg).decode("utf-8")
+        except (TypeError, ValueError):
+            pass
+    cfg = json.loads(config_json)
+    cfg["base"] = base
+    return json.dumps(cfg, separators=(",", ":"))
+
+
+def _inject_before_head_close(html, injection):
+    """
+    Insert markup just before the first </head>, or prepend it when there is no head.
+    """
+    if "</head>" in html:
+        return html.replace("</head>", injection + "</head>", 1)
+    return injection + html
+
+
+def _find_config_json(html):
+    """
+    Return the (start, end) span of Material's __config JSON, or None if it is missing.
+    """
+    start = html.find(_CONFIG_OPEN)
+    if start == -1:
+        return None
+    start += len(_CONFIG_OPEN)
+    end = html.find("</script>", start)
+    if end == -1:
+        return None
+    return start, end
+
+
+def _get_yaml_translations(config):
+    """
+    Return the flattened locale YAML for this build, reading docs/locale only once.
+    """
+    key = id(config)
+    translations = _YAML_CACHE.get(key)
+    if translations is None:
+        docs_dir = Path(config.get("docs_dir", "docs"))
+        translations = _YAML_CACHE[key] = _load_yaml_translations(docs_dir / "locale")
+    return translations
+
+
+def _get_i18n_meta(config):
+    """
+    Return the i18n plugin and its default locale, resolved once per build.
+    """
+    key = id(config)
+    meta = _I18N_CACHE.get(key)
+    if meta is None:
+        i18n = config.plugins.get("i18n")
+        default_lang = config.get("theme", {}).get("language", "en")
+        if i18n:
+            default_lang = next(
+                (lang.locale for lang in i18n.config.languages if getattr(lang, "default", False)),
+                default_lang,
+            )
+        meta = _I18N_CACHE[key] = (i18n, default_lang)
+    return meta
+
+
+def _get_translator(config):
+    """
+    Return the translator for this build, loading YAML/gettext catalogs only once.
+    """
+    key = id(config)
+    translator = _TRANSLATOR_CACHE.get(key)
+    if translator is None:
+        translator = _TRANSLATOR_CACHE[key] = _build_translator(config, _get_yaml_translations(config))
+    return translator
+
+
 def _sync_theme_translations(config):
-    docs_dir = Path(config.get("docs_dir", "docs"))
-    yaml_translations = _load_yaml_translations(docs_dir / "locale")
+    yaml_translations = _get_yaml_translations(config)
     if not yaml_translations:
         return
 
@@ -115,7 +330,7 @@ def _sync_theme_translations(config):
 
 def _sync_gettext_translations(config):
     docs_dir = Path(config.get("docs_dir", "docs"))
-    yaml_translations = _load_yaml_translations(docs_dir / "locale")
+    yaml_translations = _get_yaml_translations(config)
     if not yaml_translations:
         return
 
@@ -155,13 +370,18 @@ def _sync_gettext_translations(config):
 
 @event_priority(1000)
 def on_config(config):
+    # Drop anything left by a previous build (e.g. `mkdocs serve` reloads).
+    _YAML_CACHE.clear()
+    _I18N_CACHE.clear()
+    _TRANSLATOR_CACHE.clear()
+    _MODAL_CACHE.clear()
     _sync_gettext_translations(config)
     _sync_theme_translations(config)
     return config
 
 
 def on_env(env, config, files):
-    translator = _build_translator(config)
+    translator = _get_translator(config)
     env.globals["trans"] = translator
     env.filters["trans"] = translator
     return env
@@ -171,14 +391,10 @@ def on_page_context(context, page, config, nav):
     """
     Keep locale pages rooted at their own base so assets/search resolve inside the locale.
     """
-    i18n = config.plugins.get("i18n")
+    i18n, default_lang = _get_i18n_meta(config)
     if not i18n or not page or not hasattr(page.file, "locale"):
         return context
 
-    default_lang = next(
-        (lang.locale for lang in i18n.config.languages if getattr(lang, "default", False)),
-        config.get("theme", {}).get("language", "en"),
-    )
     page_locale = page.file.locale or default_lang
     if page_locale == default_lang:
         return context
@@ -196,12 +412,8 @@ def on_post_page(output, page, config):
     Adjust Material's base path so locale pages resolve assets/search inside their locale,
     and render simple trans() placeholders left in snippets.
     """
-    i18n = config.plugins.get("i18n")
+    i18n, default_lang = _get_i18n_meta(config)
     if i18n and page:
-        default_lang = next(
-            (lang.locale for lang in i18n.config.languages if getattr(lang, "default", False)),
-            config.get("theme", {}).get("language", "en"),
-        )
         dest_path = getattr(getattr(page, "file", None), "dest_path", "")
         page_locale = getattr(page.file, "locale", None) or default_lang
         is_404 = getattr(page, "url", "") == "404.html" or dest_path == "404.html"
@@ -219,57 +431,54 @@ def on_post_page(output, page, config):
                 depth = len(parts)
             new_base = "../" * depth or "."
 
-            m = re.search(r'(<script id="__config" type="application/json">)(.*?)(</script>)', output, flags=re.S)
-            if m:
+            span = _find_config_json(output)
+            if span:
+                start, end = span
                 try:
-                    cfg = json.loads(m.group(2))
-                    cfg["base"] = new_base
-                    new_json = json.dumps(cfg, separators=(",", ":"))
-                    output = output[: m.start(2)] + new_json + output[m.end(2) :]
+                    new_json = _set_config_base(output[start:end], new_base)
+                    output = output[:start] + new_json + output[end:]
                 except Exception:
                     # Best-effort update; regex fallback below handles malformed JSON.
                     pass
 
         # Render inline trans() placeholders left in snippets
-        translator = _build_translator(config)
+        translator = _get_translator(config)
         lang = page_locale
 
         def replace_trans(match):
             key = match.group(1).strip()
             return translator(key, lang=lang)
 
-        # match {{ trans("key") }} including cases where quotes are escaped
-        output = re.sub(r"{{\s*trans\(\s*\\?['\"]([^'\"]+)\\?['\"]\s*\)\s*}}", replace_trans, output)
+        # cheap substring guard so pages without placeholders skip the regex entirely
+        if "trans(" in output:
+            output = _TRANS_RE.sub(replace_trans, output)
 
         # normalize html lang attribute to the resolved locale
-        output = re.sub(
-            r'(<html[^>]*?lang=")[^"]*(")',
+        output = _HTML_LANG_RE.sub(
             lambda m: f"{m.group(1)}{page_locale}{m.group(2)}",
             output,
             count=1,
         )
 
-        # Inject external link modal strings for JS
-        strings = {
-            "header": translator("external_link_modal.header", lang=lang),
-            "message": translator("external_link_modal.message", lang=lang),
-            "cancel": translator("external_link_modal.cancel", lang=lang),
-            "continue": translator("external_link_modal.continue", lang=lang),
-        }
-        payload = json.dumps({lang: strings}, ensure_ascii=False)
-        # Prevent closing the script tag early if translations contain "</".
-        safe_payload = payload.replace("</", "<\\/")
-        injections = [
-            '<script id="external-link-modal-strings" type="application/json">'
-            + safe_payload
-            + "</script>"
-        ]
-
-        head_close = output.find("</head>")
-        if head_close != -1:
-            output = output[:head_close] + "".join(injections) + output[head_close:]
-        else:
-            output = "".join(injections) + output
+        # Inject external link modal strings for JS; the tag only depends on the locale
+        injection = _MODAL_CACHE.get(lang)
+        if injection is None:
+            strings = {
+                "header": translator("external_link_modal.header", lang=lang),
+                "message": translator("external_link_modal.message", lang=lang),
+                "cancel": translator("external_link_modal.cancel", lang=lang),
+                "continue": translator("external_link_modal.continue", lang=lang),
+            }
+            payload = json.dumps({lang: strings}, ensure_ascii=False)
+            # Prevent closing the script tag early if translations contain "</".
+            safe_payload = payload.replace("</", "<\\/")
+            injection = _MODAL_CACHE[lang] = (
+                '<script id="external-link-modal-strings" type="application/json">'
+                + safe_payload
+                + "</script>"
+            )
+
+        output = _inject_before_head_close(output, injection)
 
     return output
 
@@ -281,6 +490,11 @@ def on_post_build(config):
     and produce localized 404 pages with the proper header/footer and language toggle.
     """
     site_dir = Path(config["site_dir"])
+    # Release the per-build caches; the build is finished after this hook.
+    translator = _TRANSLATOR_CACHE.pop(id(config), None)
+    yaml_translations = _YAML_CACHE.pop(id(config), None)
+    _I18N_CACHE.pop(id(config), None)
+    _MODAL_CACHE.clear()
     i18n_plugin = config.plugins.get("i18n")
     if not i18n_plugin:
         return
@@ -307,13 +521,12 @@ def on_post_build(config):
         """
         Normalize the __config base setting. Prefer JSON rewrite, fall back to regex.
         """
-        m = re.search(r'(<script id="__config" type="application/json">)(.*?)(</script>)', doc_html, re.S)
-        if m:
+        span = _find_config_json(doc_html)
+        if span:
+            start, end = span
             try:
-                cfg = json.loads(m.group(2))
-                cfg["base"] = base_value
-                new_json = json.dumps(cfg, separators=(",", ":"))
-                return doc_html[: m.start(2)] + new_json + doc_html[m.end(2) :]
+                new_json = _set_config_base(doc_html[start:end], base_value)
+                return doc_html[:start] + new_json + doc_html[end:]
             except Exception:
                 pass
         return re.sub(r'"base"\s*:\s*"[^"]*"', f'"base":"{base_value}"', doc_html, count=1)
@@ -350,12 +563,14 @@ def on_post_build(config):
 
     docs = data.get("docs", [])
 
-    def is_lang_doc(doc, locale):
-        location = doc.get("location", "")
-        if locale == default_lang:
-            # default language lives at the root; exclude other locales
-            return not any(location.startswith(f"{lang}/") for lang in languages if lang != default_lang)
-        return location.startswith(f"{locale}/")
+    # bucket docs by locale in a single pass; the default language lives at the root,
+    # so anything not under another locale's prefix belongs to it
+    other_locales = {lang for lang in languages if lang != default_lang}
+    docs_by_locale = {}
+    for doc in docs:
+        head, sep, _ = doc.get("location", "").partition("/")
+        locale = head if sep and head in other_locales else default_lang
+        docs_by_locale.setdefault(locale, []).append(doc)
 
     def _normalize_location(doc, locale):
         new_doc = dict(doc)
@@ -366,22 +581,66 @@ def on_post_build(config):
                 new_doc["location"] = location[len(prefix) :]
         return new_doc
 
-    # write per-locale indexes; overwrite the root with default only
-    for locale in languages:
-        filtered_docs = [_normalize_location(doc, locale) for doc in docs if is_lang_doc(doc, locale)]
-        if not filtered_docs:
-            continue
+    # write per-locale indexes; overwrite the root with default only.
+    # Top-level fields other than docs/config are identical for every locale, so encode them once.
+    shared_fields = {key: _dump_json_bytes(value) for key, value in data.items() if key not in ("docs", "config")}
+    field_order = list(data)
+    for key in ("config", "docs"):
+        if key not in data:
+            field_order.append(key)
+    index_config = data.get("config", {})
 
-        localized = dict(data)
-        localized["docs"] = filtered_docs
-        localized["config"] = dict(localized.get("config", {}))
-        localized["config"]["lang"] = [locale]
+    def _write_index(target_path, locale, locale_docs):
+        """
+        Stream one locale's index to disk doc by doc instead of building the full payload in memory.
 
-        target_path = index_path if locale == default_lang else site_dir / locale / "search" / "search_index.json"
+        Writes go to a sibling temp file that replaces the target only once it is complete,
+        so a failure part-way through never leaves a truncated index behind.
+        """
         target_path.parent.mkdir(parents=True, exist_ok=True)
-        target_path.write_text(json.dumps(localized, ensure_ascii=False), encoding="utf-8")
-
-    translator = _build_translator(config)
+        tmp_path = target_path.with_name(target_path.name + ".tmp")
+        try:
+            with tmp_path.open("wb") as fh:
+                fh.write(b"{")
+                for position, key in enumerate(field_order):
+                    if position:
+                        fh.write(b",")
+                    fh.write(_dump_json_bytes(key) + b":")
+                    if key == "docs":
+                        fh.write(b"[")
+                        for doc_position, doc in enumerate(locale_docs):
+                            if doc_position:
+                                fh.write(b",")
+                            fh.write(_dump_json_bytes(_normalize_location(doc, locale)))
+                        fh.write(b"]")
+                    elif key == "config":
+                        fh.write(_dump_json_bytes({**index_config, "lang": [locale]}))
+                    else:
+                        fh.write(shared_fields[key])
+                fh.write(b"}")
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    targets = []
+    for locale in languages:
+        locale_docs = docs_by_locale.get(locale)
+        if not locale_docs:
+            continue
+        target_path = index_path if locale == default_lang else site_dir / locale / "search" / "search_index.json"
+        targets.append((target_path, locale, locale_docs))
+
+    if targets:
+        with ThreadPoolExecutor(max_workers=min(8, len(targets))) as executor:
+            # list() so any write error is raised here rather than swallowed
+            list(executor.map(_write_index, *zip(*targets)))
+
+    if translator is None:
+        # Build outside the caches so nothing is left behind once the build ends.
+        if yaml_translations is None:
+            yaml_translations = _load_yaml_translations(Path(config.get("docs_dir", "docs")) / "locale")
+        translator = _build_translator(config, yaml_translations)
     title_map = {
         lang_cfg.locale: translator("error.404_title", lang=lang_cfg.locale)
         for lang_cfg in i18n_plugin.config.languages
@@ -570,19 +829,13 @@ def on_post_build(config):
         )
         html_404 = _strip_feedback_block(html_404)
         html_404 = _strip_404_lang_injection(html_404)
-        base_html = html_404
-        head_close = base_html.find("</head>")
-        if head_close != -1:
-            base_html = base_html[:head_close] + lang_injection + base_html[head_close:]
-        else:
-            base_html = lang_injection + base_html
+        base_html = _inject_before_head_close(html_404, lang_injection)
         base_404.write_text(base_html, encoding="utf-8")
         for lang_cfg in i18n_plugin.config.languages:
             locale = lang_cfg.locale
             translated_title = title_map.get(locale, "404")
 
-            localized = re.sub(
-                r'(<html[^>]*?lang=")[^"]*(")',
+            localized = _HTML_LANG_RE.sub(
                 lambda m: f"{m.group(1)}{locale}{m.group(2)}",
                 html_404,
                 count=1,
@@ -652,11 +905,7 @@ def on_post_build(config):
             base_value = "."
             localized = _replace_config_base(localized, base_value)
 
-            head_close = localized.find("</head>")
-            if head_close != -1:
-                localized = localized[:head_close] + lang_injection + localized[head_close:]
-            else:
-                localized = lang_injection + localized
+            localized = _inject_before_head_close(localized, lang_injection)
 
             dest = site_dir / ("" if getattr(lang_cfg, "default", False) else locale) / "404.html"
             dest.parent.mkdir(parents=True, exist_ok=True)